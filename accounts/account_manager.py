@@ -1,5 +1,7 @@
 # accounts/account_manager.py
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional
 from .account_info import AccountInfo
@@ -18,6 +20,10 @@ class AccountManager:
         self.original_account_id = None
         self.original_zone = None
         
+        # build_req_headers mutates a dict shared by the webull instance
+        self._headers_lock = threading.Lock()
+        self.max_detail_workers = 8
+        
         # Account type mapping from Webull API
         self.account_type_mapping = {
             'CASH': 'Cash Account',
@@ -62,6 +68,7 @@ class AccountManager:
             
             # Process each account automatically
             active_accounts = 0
+            discovered = []
             for i, account_info in enumerate(accounts_data):
                 self.logger.debug(f"Processing account {i+1}: {account_info.get('secAccountId', 'Unknown ID')}")
                 
@@ -94,12 +101,19 @@ class AccountManager:
                 
                 self.accounts[str(account_id)] = account
                 active_accounts += 1
-                
-                # Load detailed account info
-                if self._load_account_details(account):
-                    self.logger.debug(f"✅ {account_type} Account loaded: ${account.net_liquidation:.2f}")
-                else:
-                    self.logger.warning(f"⚠️ Could not load details for {account_type} account")
+                discovered.append(account)
+            
+            # Load detailed account info - one independent request per account, so fetch concurrently
+            if discovered:
+                with ThreadPoolExecutor(max_workers=min(self.max_detail_workers, len(discovered))) as executor:
+                    futures = {executor.submit(self._load_account_details, account, True): account
+                               for account in discovered}
+                    for future in as_completed(futures):
+                        account = futures[future]
+                        if future.result():
+                            self.logger.debug(f"✅ {account.account_type} Account loaded: ${account.net_liquidation:.2f}")
+                        else:
+                            self.logger.warning(f"⚠️ Could not load details for {account.account_type} account")
             
             if not self.accounts:
                 self.logger.error("❌ No active accounts found")
@@ -130,20 +144,36 @@ class AccountManager:
         self.logger.debug(f"   Account type from brokerName: {broker_name} -> {mapped_type}")
         return mapped_type
     
-    def _load_account_details(self, account: AccountInfo) -> bool:
-        """Load detailed information for a specific account"""
+    def _fetch_account_data(self, account: AccountInfo) -> Dict:
+        """Fetch account details without switching the shared Webull account context"""
+        with self._headers_lock:
+            headers = dict(self.wb.build_req_headers())
+        headers['lzone'] = account.zone
+        
+        response = self.wb._session.get(self.wb._urls.account(account.account_id), headers=headers, timeout=self.wb.timeout)
+        return response.json()
+    
+    def _load_account_details(self, account: AccountInfo, isolated: bool = False) -> bool:
+        """
+        Load detailed information for a specific account
+        With isolated=True the shared Webull account context is left untouched,
+        so several accounts can be loaded concurrently
+        """
         try:
             self.logger.debug(f"Loading details for account {account.account_id} ({account.account_type})")
             
-            # Switch to this account
-            self.wb._account_id = account.account_id
-            self.wb.zone_var = account.zone
-            
-            self.logger.debug(f"   Set wb._account_id to: {self.wb._account_id}")
-            self.logger.debug(f"   Set wb.zone_var to: {self.wb.zone_var}")
-            
-            # Get account details
-            account_data = self.wb.get_account()
+            if isolated:
+                account_data = self._fetch_account_data(account)
+            else:
+                # Switch to this account
+                self.wb._account_id = account.account_id
+                self.wb.zone_var = account.zone
+                
+                self.logger.debug(f"   Set wb._account_id to: {self.wb._account_id}")
+                self.logger.debug(f"   Set wb.zone_var to: {self.wb.zone_var}")
+                
+                # Get account details
+                account_data = self.wb.get_account()
             
             if not account_data:
                 self.logger.warning(f"⚠️ No account data returned for {account.account_id}")
@@ -335,34 +365,40 @@ class AccountManager:
     
     def get_account_summary(self) -> Dict:
         """Get summary of all accounts using PersonalTradingConfig"""
+        accounts = list(self.accounts.values())
+        
+        # Per-field columns built in one pass each; totals are a single sum() over a column
+        net_liquidation = [account.net_liquidation for account in accounts]
+        settled_funds = [account.settled_funds for account in accounts]
+        positions_count = [len(account.positions) for account in accounts]
+        enabled = [account.is_enabled_for_trading(self.config) for account in accounts]
+        
         summary = {
-            'total_accounts': len(self.accounts),
-            'enabled_accounts': len(self.get_enabled_accounts()),
-            'total_value': 0.0,
-            'total_cash': 0.0,
-            'total_positions': 0,
+            'total_accounts': len(accounts),
+            'enabled_accounts': sum(enabled),
+            'total_value': sum(net_liquidation, 0.0),
+            'total_cash': sum(settled_funds, 0.0),
+            'total_positions': sum(positions_count),
             'accounts': []
         }
         
-        for account in self.accounts.values():
+        for account, value, funds, count, is_enabled in zip(accounts, net_liquidation, settled_funds,
+                                                             positions_count, enabled):
             account_config = account.get_account_config(self.config)
             
             account_summary = {
                 'account_id': account.account_id,
                 'account_type': account.account_type,
-                'enabled': account.is_enabled_for_trading(self.config),
-                'net_liquidation': account.net_liquidation,
-                'settled_funds': account.settled_funds,
-                'positions_count': len(account.positions),
+                'enabled': is_enabled,
+                'net_liquidation': value,
+                'settled_funds': funds,
+                'positions_count': count,
                 'day_trading_enabled': account_config.get('day_trading_enabled', False),
                 'options_enabled': account_config.get('options_enabled', False),
                 'day_trades_used': account.day_trades_used
             }
             
             summary['accounts'].append(account_summary)
-            summary['total_value'] += account.net_liquidation
-            summary['total_cash'] += account.settled_funds
-            summary['total_positions'] += len(account.positions)
         
         return summary
     
@@ -2,6 +2,7 @@
 import os
 import json
 import logging
+import time
 from datetime import datetime
 from cryptography.fernet import Fernet
 from pathlib import Path
@@ -9,7 +10,7 @@ from pathlib import Path
 class CredentialManager:
     """Handles encrypted credential storage and retrieval in data folder"""
     
-    def __init__(self, data_folder="data", credentials_file="trading_credentials.enc", key_file="trading_key.key", logger=None):
+    def __init__(self, data_folder="data", credentials_file="trading_credentials.enc", key_file="trading_key.key", logger=None, cache_ttl=300):
         # Create data folder if it doesn't exist
         self.data_folder = Path(data_folder)
         self.data_folder.mkdir(exist_ok=True)
@@ -18,6 +19,19 @@ class CredentialManager:
         self.credentials_file = self.data_folder / credentials_file
         self.key_file = self.data_folder / key_file
         self.logger = logger or logging.getLogger(__name__)
+        
+        # Decrypted credentials cache: (monotonic load time, credentials)
+        self.cache_ttl = cache_ttl
+        self._cache = None
+        
+        # credentials_exist cache: (monotonic check time, result)
+        self.exists_ttl = 5
+        self._exists_cache = None
+    
+    def clear_cache(self):
+        """Forget cached decrypted credentials and existence checks"""
+        self._cache = None
+        self._exists_cache = None
     
     def generate_key(self):
         """Generate encryption key for credentials"""
@@ -66,6 +80,7 @@ class CredentialManager:
             # Save encrypted credentials
             with open(self.credentials_file, 'wb') as file:
                 file.write(encrypted_credentials)
+            self.clear_cache()
             
             self.logger.info(f"Credentials encrypted and saved to {self.credentials_file}")
             return True
@@ -75,7 +90,13 @@ class CredentialManager:
             return False
     
     def load_credentials(self) -> dict:
-        """Load and decrypt trading credentials"""
+        """Load and decrypt trading credentials (cached for cache_ttl seconds)"""
+        if self._cache is not None:
+            loaded_at, credentials = self._cache
+            if time.monotonic() - loaded_at < self.cache_ttl:
+                self.logger.debug("Using cached credentials")
+                return dict(credentials)
+        
         try:
             # Check if files exist
             if not self.credentials_file.exists():
@@ -99,18 +120,26 @@ class CredentialManager:
             credentials = json.loads(decrypted_credentials.decode())
             
             self.logger.info("Credentials loaded successfully")
-            return credentials
+            self._cache = (time.monotonic(), credentials)
+            return dict(credentials)
             
         except Exception as e:
             self.logger.error(f"Failed to load credentials: {e}")
             raise
     
     def credentials_exist(self) -> bool:
-        """Check if encrypted credentials exist"""
-        return self.credentials_file.exists() and self.key_file.exists()
+        """Check if encrypted credentials exist (cached for exists_ttl seconds)"""
+        now = time.monotonic()
+        if self._exists_cache is not None and now - self._exists_cache[0] < self.exists_ttl:
+            return self._exists_cache[1]
+        
+        exists = self.credentials_file.exists() and self.key_file.exists()
+        self._exists_cache = (now, exists)
+        return exists
     
     def delete_credentials(self) -> bool:
         """Delete stored credentials (for security)"""
+        self.clear_cache()
         try:
             if self.credentials_file.exists():
                 self.credentials_file.unlink()
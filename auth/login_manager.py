@@ -34,9 +34,11 @@ class LoginManager:
                     self.logger.error("❌ Invalid credentials found")
                     return False
                 
-                # Set DID if provided
-                if credentials.get('did'):
-                    self.wb._set_did(credentials['did'])
+                # Set DID if provided (skip the did.bin rewrite when it's already in use)
+                stored_did = credentials.get('did')
+                if stored_did and stored_did != getattr(self.wb, '_did', None):
+                    self.wb._set_did(stored_did)
+                    self.wb._did = stored_did
                     self.logger.info("DID set from stored credentials")
                 
                 # Login to Webull
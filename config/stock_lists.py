@@ -4,10 +4,19 @@ Stock Lists Configuration - Optimized and Clean
 Centralized stock symbol management for different trading strategies
 """
 
-from typing import List, Dict, Set, Optional
+from types import MappingProxyType
+from typing import List, Dict, Set, Optional, Tuple, FrozenSet, Mapping
 from datetime import datetime
+from itertools import chain, islice
+from sys import intern
 import logging
 
+
+def _dedup(symbols: List[str]) -> List[str]:
+    """Remove duplicate symbols while preserving order"""
+    return list(dict.fromkeys(symbols))
+
+
 class StockLists:
     """
     Optimized stock lists with validation, deduplication, and better organization
@@ -26,7 +35,7 @@ class StockLists:
     ]
     
     # Mean reversion optimized for 2025 market (reduced and focused)
-    MEAN_REVERSION = [
+    MEAN_REVERSION = _dedup([
         # Core ETFs for liquidity and clean signals
         *CORE_ETFS,
         
@@ -47,7 +56,7 @@ class StockLists:
         
         # Utilities - Low volatility boundaries
         'DUK', 'SO', 'NEE',
-    ]
+    ])
     
     # Sector rotation - All major sectors
     SECTOR_ROTATION = [
@@ -96,7 +105,7 @@ class StockLists:
     ]
     
     # High liquidity breakout candidates
-    MICROSTRUCTURE_BREAKOUT = [
+    MICROSTRUCTURE_BREAKOUT = _dedup([
         # Major ETFs with tightest spreads
         *SECTOR_ROTATION,
         'SPY', 'QQQ', 'IWM', 'VTI', 'VTV', 'VUG',
@@ -107,7 +116,7 @@ class StockLists:
         
         # High volume growth names
         'AMD', 'NFLX', 'CRM', 'ADBE',
-    ]
+    ])
     
     # Fed policy sensitive
     POLICY_MOMENTUM = [
@@ -128,7 +137,7 @@ class StockLists:
     ]
     
     # Gap trading optimized
-    GAP_TRADING = [
+    GAP_TRADING = _dedup([
         # High volume ETFs
         *CORE_ETFS,
         'ARKK', 'GLD', 'TLT', 'HYG',
@@ -141,7 +150,7 @@ class StockLists:
         
         # Volatile value plays
         'CVS', 'BA', 'X', 'FCX',
-    ]
+    ])
     
     # Bullish momentum
     BULLISH_MOMENTUM = [
@@ -168,12 +177,12 @@ class StockLists:
         'VGK', 'EWJ',         # International (15%)
     ]
     
-    AGGRESSIVE_STRATEGY = [
+    AGGRESSIVE_STRATEGY = _dedup([
         'QQQ', 'NVDA', 'TSLA', 'AMD',  # Growth (40%)
         *SECTOR_ROTATION[:5],           # Sector rotation (30%)
         'VWO', 'EWY', 'INDA',          # International growth (15%)
         'SPY', 'IWM',                   # Momentum (15%)
-    ]
+    ])
     
     BALANCED_STRATEGY = [
         'SPY', 'QQQ', 'VTV', 'VEA',    # Core (50%)
@@ -182,6 +191,47 @@ class StockLists:
         'VGK', 'VWO',                  # International (10%)
     ]
     
+    # Strategy name -> source symbol list
+    _STRATEGY_MAPPING: Dict[str, List[str]] = {
+        'MeanReversion': MEAN_REVERSION,
+        'SectorRotation': SECTOR_ROTATION,
+        'International': INTERNATIONAL_OUTPERFORMANCE,
+        'ValueRate': VALUE_RATE_UNIVERSE,
+        'MicrostructureBreakout': MICROSTRUCTURE_BREAKOUT,
+        'PolicyMomentum': POLICY_MOMENTUM,
+        'GapTrading': GAP_TRADING,
+        'BullishMomentumDip': BULLISH_MOMENTUM,
+        'Conservative': CONSERVATIVE_STRATEGY,
+        'Aggressive': AGGRESSIVE_STRATEGY,
+        'Balanced': BALANCED_STRATEGY,
+    }
+    
+    # Names of the symbol lists above; normalized <NAME>_TUPLE versions are
+    # precomputed once at import time (see bottom of module)
+    _SYMBOL_LIST_NAMES = (
+        'CORE_ETFS', 'MEAN_REVERSION', 'SECTOR_ROTATION',
+        'INTERNATIONAL_OUTPERFORMANCE', 'VALUE_RATE_UNIVERSE',
+        'MICROSTRUCTURE_BREAKOUT', 'POLICY_MOMENTUM', 'GAP_TRADING',
+        'BULLISH_MOMENTUM', 'CONSERVATIVE_STRATEGY', 'AGGRESSIVE_STRATEGY',
+        'BALANCED_STRATEGY',
+    )
+    _ALL_LISTS: Tuple[List[str], ...] = ()
+    # id() of each precomputed tuple -> that tuple (tuples can't go stale)
+    _CANONICAL: Dict[int, Tuple[str, ...]] = {}
+    
+    # Strategy name -> precomputed tuple and frozenset, built at import time
+    _STRATEGY_TUPLES: Dict[str, Tuple[str, ...]] = {}
+    _STRATEGY_SETS: Dict[str, FrozenSet[str]] = {}
+    
+    # Read-only strategy metadata, built at import time
+    _STRATEGY_INFO: Mapping[str, Mapping] = MappingProxyType({})
+    
+    # Inverted index of ticker -> strategy names, built at import time
+    _TICKER_TO_STRATEGIES: Dict[str, FrozenSet[str]] = {}
+    
+    # Lazily populated caches - the lists above never change at runtime
+    _all_symbols: Optional[FrozenSet[str]] = None
+    
     # =================================================================
     # VALIDATION AND UTILITY METHODS
     # =================================================================
@@ -194,113 +244,65 @@ class StockLists:
         - Check format
         - Log warnings for unusual symbols
         """
-        logger = logging.getLogger(__name__)
+        # The precomputed <NAME>_TUPLE objects are already clean
+        if cls._CANONICAL.get(id(symbol_list)) is symbol_list:
+            return list(symbol_list)
         
-        # Remove duplicates while preserving order
-        cleaned_symbols = []
-        seen = set()
+        logger = logging.getLogger(__name__)
         
+        # Basic validation (single pass, so any iterable works)
+        valid_symbols = []
         for symbol in symbol_list:
-            if symbol not in seen:
-                # Basic validation
-                if not symbol or not isinstance(symbol, str):
-                    logger.warning(f"Invalid symbol: {symbol}")
-                    continue
-                    
-                # Clean up symbol
-                symbol = symbol.strip().upper()
-                
-                # Check for unusual formats
+            if isinstance(symbol, str) and symbol.strip():
+                valid_symbols.append(symbol)
+            else:
+                logger.warning("Invalid symbol: %r", symbol)
+        
+        # Clean up and remove duplicates while preserving order
+        cleaned_symbols = list(dict.fromkeys(map(str.upper, map(str.strip, valid_symbols))))
+        
+        # Check for unusual formats
+        if logger.isEnabledFor(logging.INFO):
+            for symbol in cleaned_symbols:
                 if len(symbol) > 6:
-                    logger.info(f"Long symbol detected: {symbol}")
-                
-                cleaned_symbols.append(symbol)
-                seen.add(symbol)
+                    logger.info("Long symbol detected: %s", symbol)
         
         return cleaned_symbols
     
     @classmethod
-    def get_stocks_for_strategy(cls, strategy_name: str) -> List[str]:
-        """Get validated stock list for strategy"""
-        
-        strategy_mapping = {
-            'MeanReversion': cls.MEAN_REVERSION,
-            'SectorRotation': cls.SECTOR_ROTATION,
-            'International': cls.INTERNATIONAL_OUTPERFORMANCE,
-            'ValueRate': cls.VALUE_RATE_UNIVERSE,
-            'MicrostructureBreakout': cls.MICROSTRUCTURE_BREAKOUT,
-            'PolicyMomentum': cls.POLICY_MOMENTUM,
-            'GapTrading': cls.GAP_TRADING,
-            'BullishMomentumDip': cls.BULLISH_MOMENTUM,
-            'Conservative': cls.CONSERVATIVE_STRATEGY,
-            'Aggressive': cls.AGGRESSIVE_STRATEGY,
-            'Balanced': cls.BALANCED_STRATEGY,
-        }
-        
-        symbol_list = strategy_mapping.get(strategy_name, cls.MEAN_REVERSION)
-        return cls.validate_symbols(symbol_list)
+    def get_stocks_for_strategy(cls, strategy_name: str) -> Tuple[str, ...]:
+        """Get validated stock list for strategy (precomputed, immutable)"""
+        return cls._STRATEGY_TUPLES.get(strategy_name, cls.MEAN_REVERSION_TUPLE)
     
     @classmethod
-    def get_all_unique_symbols(cls) -> Set[str]:
-        """Get all unique symbols across all strategies"""
-        all_symbols = set()
+    def get_all_unique_symbols(cls) -> FrozenSet[str]:
+        """Get all unique symbols across all strategies (cached)"""
+        if cls._all_symbols is not None:
+            return cls._all_symbols
         
         # Collect from all major lists
-        for attr_name in dir(cls):
-            if not attr_name.startswith('_') and attr_name.isupper():
-                attr_value = getattr(cls, attr_name)
-                if isinstance(attr_value, list):
-                    all_symbols.update(attr_value)
-        
-        return all_symbols
+        cls._all_symbols = frozenset().union(*cls._ALL_LISTS)
+        return cls._all_symbols
     
     @classmethod
-    def get_strategy_info(cls) -> Dict[str, Dict]:
+    def get_strategy_info(cls) -> Mapping[str, Mapping]:
         """Get comprehensive strategy information"""
-        return {
-            'MeanReversion': {
-                'count': len(cls.MEAN_REVERSION),
-                'description': 'Optimized mean reversion with focus on 2025 market conditions',
-                'market_condition': 'RANGE_BOUND',
-                'risk_level': 'Medium',
-                'expected_trades_per_week': '3-5'
-            },
-            'SectorRotation': {
-                'count': len(cls.SECTOR_ROTATION),
-                'description': 'Systematic sector momentum rotation',
-                'market_condition': 'TRENDING',
-                'risk_level': 'Medium-High',
-                'expected_trades_per_week': '2-3'
-            },
-            'International': {
-                'count': len(cls.INTERNATIONAL_OUTPERFORMANCE),
-                'description': 'Global diversification and international opportunities',
-                'market_condition': 'ANY',
-                'risk_level': 'Medium',
-                'expected_trades_per_week': '1-2'
-            },
-            'ValueRate': {
-                'count': len(cls.VALUE_RATE_UNIVERSE),
-                'description': 'Rate-sensitive value plays (REITs and financials)',
-                'market_condition': 'RATE_ENVIRONMENT',
-                'risk_level': 'Medium-Low',
-                'expected_trades_per_week': '2-4'
-            },
-            'GapTrading': {
-                'count': len(cls.GAP_TRADING),
-                'description': 'High-volume gap reversal opportunities',
-                'market_condition': 'HIGH_VOLATILITY',
-                'risk_level': 'High',
-                'expected_trades_per_week': '5-10'
-            }
-        }
+        return cls._STRATEGY_INFO
     
     @classmethod
-    def get_symbol_overlap(cls, strategy1: str, strategy2: str) -> Set[str]:
+    def _strategy_frozenset(cls, strategy_name: str) -> FrozenSet[str]:
+        """Get precomputed symbol set for strategy (unknown names use MeanReversion)"""
+        return cls._STRATEGY_SETS.get(strategy_name, cls._STRATEGY_SETS['MeanReversion'])
+    
+    @classmethod
+    def get_symbol_overlap(cls, strategy1: str, strategy2: str) -> FrozenSet[str]:
         """Find overlapping symbols between two strategies"""
-        list1 = set(cls.get_stocks_for_strategy(strategy1))
-        list2 = set(cls.get_stocks_for_strategy(strategy2))
-        return list1.intersection(list2)
+        return cls._strategy_frozenset(strategy1) & cls._strategy_frozenset(strategy2)
+    
+    @classmethod
+    def strategies_containing(cls, ticker: str) -> FrozenSet[str]:
+        """Find all strategies that include the given ticker"""
+        return cls._TICKER_TO_STRATEGIES.get(ticker.strip().upper(), frozenset())
     
     @classmethod
     def optimize_for_performance(cls, max_symbols_per_strategy: int = 50) -> Dict[str, List[str]]:
@@ -311,16 +313,91 @@ class StockLists:
         optimized = {}
         
         # Core optimized lists focusing on highest volume/liquidity
-        optimized['MeanReversion'] = cls.CORE_ETFS + [
+        # (unique symbols, capped at max_symbols_per_strategy)
+        optimized['MeanReversion'] = list(islice(dict.fromkeys(chain(cls.CORE_ETFS, (
             'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA',
             'JPM', 'BAC', 'XOM', 'CVX', 'JNJ', 'PG', 'O', 'USB'
-        ][:max_symbols_per_strategy]
+        ))), max_symbols_per_strategy))
         
         optimized['SectorRotation'] = cls.SECTOR_ROTATION  # Already optimized
         
-        optimized['GapTrading'] = cls.CORE_ETFS + [
+        optimized['GapTrading'] = list(islice(dict.fromkeys(chain(cls.CORE_ETFS, (
             'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META',
             'AMD', 'NFLX', 'CRM'
-        ][:max_symbols_per_strategy]
+        ))), max_symbols_per_strategy))
         
         return optimized
+
+
+StockLists._ALL_LISTS = tuple(getattr(StockLists, _name) for _name in StockLists._SYMBOL_LIST_NAMES)
+
+# Intern every ticker so repeated set/dict operations reuse one cached hash
+# and equality checks short-circuit on identity
+for _symbols in StockLists._ALL_LISTS:
+    _symbols[:] = [intern(s) for s in _symbols]
+
+# Precompute normalized, deduplicated tuples once at import time
+_tuple_for_list: Dict[int, Tuple[str, ...]] = {}
+for _name in StockLists._SYMBOL_LIST_NAMES:
+    _source = getattr(StockLists, _name)
+    _symbols = tuple(intern(s) for s in StockLists.validate_symbols(_source))
+    setattr(StockLists, _name + '_TUPLE', _symbols)
+    StockLists._CANONICAL[id(_symbols)] = _tuple_for_list[id(_source)] = _symbols
+del _name, _source, _symbols
+
+# Map strategy names to their precomputed tuples
+StockLists._STRATEGY_TUPLES = {
+    _strategy: _tuple_for_list[id(_symbols)]
+    for _strategy, _symbols in StockLists._STRATEGY_MAPPING.items()
+}
+del _tuple_for_list
+StockLists._STRATEGY_SETS = {
+    _strategy: frozenset(_symbols) for _strategy, _symbols in StockLists._STRATEGY_TUPLES.items()
+}
+
+# Build the ticker -> strategies inverted index from the normalized lists
+_index: Dict[str, Set[str]] = {}
+for _strategy, _symbols in StockLists._STRATEGY_TUPLES.items():
+    for _ticker in _symbols:
+        _index.setdefault(_ticker, set()).add(_strategy)
+StockLists._TICKER_TO_STRATEGIES = {t: frozenset(names) for t, names in _index.items()}
+del _index, _strategy, _symbols, _ticker
+
+# Strategy info never changes, so build it once and share a read-only view
+StockLists._STRATEGY_INFO = MappingProxyType({
+    'MeanReversion': MappingProxyType({
+        'count': len(StockLists.MEAN_REVERSION),
+        'description': 'Optimized mean reversion with focus on 2025 market conditions',
+        'market_condition': 'RANGE_BOUND',
+        'risk_level': 'Medium',
+        'expected_trades_per_week': '3-5'
+    }),
+    'SectorRotation': MappingProxyType({
+        'count': len(StockLists.SECTOR_ROTATION),
+        'description': 'Systematic sector momentum rotation',
+        'market_condition': 'TRENDING',
+        'risk_level': 'Medium-High',
+        'expected_trades_per_week': '2-3'
+    }),
+    'International': MappingProxyType({
+        'count': len(StockLists.INTERNATIONAL_OUTPERFORMANCE),
+        'description': 'Global diversification and international opportunities',
+        'market_condition': 'ANY',
+        'risk_level': 'Medium',
+        'expected_trades_per_week': '1-2'
+    }),
+    'ValueRate': MappingProxyType({
+        'count': len(StockLists.VALUE_RATE_UNIVERSE),
+        'description': 'Rate-sensitive value plays (REITs and financials)',
+        'market_condition': 'RATE_ENVIRONMENT',
+        'risk_level': 'Medium-Low',
+        'expected_trades_per_week': '2-4'
+    }),
+    'GapTrading': MappingProxyType({
+        'count': len(StockLists.GAP_TRADING),
+        'description': 'High-volume gap reversal opportunities',
+        'market_condition': 'HIGH_VOLATILITY',
+        'risk_level': 'High',
+        'expected_trades_per_week': '5-10'
+    })
+})
@@ -4,22 +4,158 @@ Enhanced Automated Multi-Account Trading System - FIXED MAIN.PY
 Handles authentication, account discovery, and comprehensive logging
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-import traceback
+import threading
 import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
 
-# Import our modules
-from webull.webull import webull
+# Import our modules (the rest are imported in _initialize_system)
 from auth.credentials import CredentialManager
-from auth.login_manager import LoginManager
-from auth.session_manager import SessionManager
-from accounts.account_manager import AccountManager
-from config.config import PersonalTradingConfig
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that batches writes in a large stream buffer instead of
+    flushing after every record. A background thread flushes pending writes
+    every flush_interval seconds; WARNING and above are flushed immediately,
+    and the buffer is flushed on close.
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None,
+                 buffer_size=64 * 1024, flush_interval=0.5):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._dirty = False
+        super().__init__(filename, mode, encoding, delay, errors)
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='log-file-flush', daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            if self._dirty:
+                self.flush()
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._dirty = True
+            
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            self._dirty = False
+            super().flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self._stop_event.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        super().close()
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Bounded in-memory log buffer. Records are held in a ring buffer of
+    `capacity` entries and handed to `target` every flush_interval seconds
+    by a background thread. When the buffer is full the oldest record is
+    dropped; the number of dropped records is reported as a WARNING on the
+    next flush.
+    """
+    
+    def __init__(self, target, capacity=4096, flush_interval=0.5):
+        super().__init__()
+        self.target = target
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        # Records taken out of the ring but not yet handed to target, in order
+        self._outbox = deque()
+        # Serializes delivery to target; never held while acquiring the handler
+        # lock, since logging.shutdown() calls flush()/close() with it held
+        self._dispatch_lock = threading.Lock()
+        self._closed = False
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='log-ring-flush', daemon=True)
+        self._flusher.start()
+    
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record):
+        try:
+            # Render the message now - args may change before the record is flushed
+            record.msg = record.getMessage()
+            record.args = None
+            if len(self.buffer) == self.capacity:
+                self.dropped += 1
+            self.buffer.append(record)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        # Move buffered records to the outbox under the handler lock only
+        self.acquire()
+        try:
+            if self.dropped:
+                self._outbox.append(logging.makeLogRecord({
+                    'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                    'msg': f"⚠️ Log buffer full - dropped {self.dropped} record(s)"
+                }))
+                self.dropped = 0
+            self._outbox.extend(self.buffer)
+            self.buffer.clear()
+        finally:
+            self.release()
+        
+        # Deliver outside the handler lock
+        with self._dispatch_lock:
+            if self._closed:
+                return
+            while self._outbox:
+                record = self._outbox.popleft()
+                if record.levelno >= self.target.level:
+                    self.target.handle(record)
+            self.target.flush()
+    
+    def close(self):
+        # The flusher is not joined: close() may run with the handler lock held
+        self._stop_event.set()
+        self.flush()
+        with self._dispatch_lock:
+            if not self._closed:
+                self._closed = True
+                self.target.close()
+        super().close()
+
 
 class MainSystem:
     """
@@ -37,6 +173,19 @@ class MainSystem:
         self.session_manager = None
         self.account_manager = None
         self.is_logged_in = False
+        self._log_listener = None
+        self._log_ring = None
+        
+        # Background pool for advisory file writes (did.bin) off the login path
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='did-io')
+        
+        # Cached authentication results (monotonic timestamps)
+        self._auth_cache_ttl = 5.0  # seconds, doubled per consecutive failure
+        self._auth_max_backoff = 60.0
+        self._auth_success_ttl = 300.0
+        self._auth_fail_count = 0
+        self._last_auth_fail_ts = 0.0
+        self._auth_success_until = 0.0
         
         # Set up logging first
         self.setup_logging()
@@ -45,37 +194,78 @@ class MainSystem:
         self._initialize_system()
     
     def setup_logging(self):
-        """Set up comprehensive logging to /logs directory"""
+        """
+        Set up comprehensive logging to /logs directory
+        Set TRADING_LOG_SYSLOG to send the log to syslog (facility LOCAL0) instead
+        of a file - either '1' for /dev/log or the path of another syslog socket
+        Set TRADING_LOG_RING to buffer log writes in a bounded in-memory ring
+        instead of an unbounded queue
+        """
         try:
-            # Create logs directory if it doesn't exist
-            logs_dir = Path("logs")
-            logs_dir.mkdir(exist_ok=True)
+            formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s',  # Simplified format
+                datefmt='%H:%M:%S'  # Shorter time format
+            )
+            stream_handler = logging.StreamHandler(sys.stdout)  # Also log to console
+            stream_handler.setFormatter(formatter)
+            
+            syslog_target = os.environ.get('TRADING_LOG_SYSLOG')
+            if syslog_target:
+                # The kernel buffers the datagram and the syslog daemon does the disk write
+                address = syslog_target if syslog_target.startswith('/') else '/dev/log'
+                file_handler = logging.handlers.SysLogHandler(
+                    address=address, facility=logging.handlers.SysLogHandler.LOG_LOCAL0
+                )
+                file_handler.setFormatter(logging.Formatter('trading_system: %(levelname)s - %(message)s'))
+                log_destination = f"syslog ({address}, local0)"
+            else:
+                # Create logs directory if it doesn't exist
+                logs_dir = Path("logs")
+                logs_dir.mkdir(exist_ok=True)
+                
+                # Create timestamped log filename
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                log_filename = logs_dir / f"trading_system_{timestamp}.log"
+                
+                file_handler = BufferedFileHandler(log_filename, encoding='utf-8')
+                file_handler.setFormatter(formatter)
+                log_destination = log_filename.name
             
-            # Create timestamped log filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = logs_dir / f"trading_system_{timestamp}.log"
+            # Log writes happen on a background thread; callers only enqueue.
+            # Console output stays synchronous so it interleaves with print().
+            if os.environ.get('TRADING_LOG_RING'):
+                # Bounded memory under log storms - oldest records are dropped
+                self._log_ring = RingBufferHandler(file_handler)
+                # Flush the ring at exit even if MainSystem() fails before cleanup()
+                atexit.register(self._log_ring.close)
+                log_handler = self._log_ring
+            else:
+                log_queue = queue.Queue(-1)
+                self._log_listener = logging.handlers.QueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                self._log_listener.start()
+                # Drain the queue at exit even if MainSystem() fails before cleanup()
+                atexit.register(self._stop_log_listener)
+                log_handler = logging.handlers.QueueHandler(log_queue)
+                log_handler.setFormatter(logging.Formatter('%(message)s'))
             
             # Configure root logger
             logging.basicConfig(
                 level=logging.INFO,  # Changed from DEBUG to INFO for cleaner output
-                format='%(asctime)s - %(levelname)s - %(message)s',  # Simplified format
-                datefmt='%H:%M:%S',  # Shorter time format
-                handlers=[
-                    logging.FileHandler(log_filename, encoding='utf-8'),
-                    logging.StreamHandler(sys.stdout)  # Also log to console
-                ],
+                handlers=[log_handler, stream_handler],
                 force=True  # Force reconfiguration
             )
             
             # Create logger for this module
             self.logger = logging.getLogger(__name__)
-            self.logger.info("🚀 ENHANCED MULTI-ACCOUNT TRADING SYSTEM")
-            self.logger.info(f"📝 Log: {log_filename.name}")
+            self.logger.info("🚀 ENHANCED MULTI-ACCOUNT TRADING SYSTEM\n📝 Log: %s", log_destination)
             print()  # Add spacing for readability
             
         except Exception as e:
+            import traceback  # Only needed on this failure path
             print(f"❌ CRITICAL: Failed to setup logging: {e}")
-            print(traceback.format_exc())
+            traceback.print_exc(file=sys.stdout)
             sys.exit(1)
     
     def _initialize_system(self):
@@ -83,6 +273,13 @@ class MainSystem:
         try:
             self.logger.info("🔧 Initializing system components...")
             
+            # Deferred so importing main.py doesn't pull in webull/pandas
+            from webull.webull import webull
+            from auth.login_manager import LoginManager
+            from auth.session_manager import SessionManager
+            from accounts.account_manager import AccountManager
+            from config.config import PersonalTradingConfig
+            
             # Initialize all components
             self.config = PersonalTradingConfig()
             
@@ -105,6 +302,31 @@ class MainSystem:
             raise
         
     def authenticate(self) -> bool:
+        """Authenticate, reusing a recent result instead of hitting the network again"""
+        now = time.monotonic()
+        
+        if self.is_logged_in and now < self._auth_success_until:
+            return True
+        
+        if self._auth_fail_count:
+            backoff = min(self._auth_cache_ttl * 2 ** (self._auth_fail_count - 1), self._auth_max_backoff)
+            if now - self._last_auth_fail_ts < backoff:
+                self.logger.warning("⏳ Authentication failed recently, retry in %.1fs",
+                                    backoff - (now - self._last_auth_fail_ts))
+                return False
+        
+        success = self._authenticate()
+        
+        if success:
+            self._auth_fail_count = 0
+            self._auth_success_until = time.monotonic() + self._auth_success_ttl
+        else:
+            self._auth_fail_count += 1
+            self._last_auth_fail_ts = time.monotonic()
+        
+        return success
+    
+    def _authenticate(self) -> bool:
         """Handle authentication using the modular authentication system"""
         try:
             self.logger.info("🔐 Authenticating...")
@@ -120,8 +342,8 @@ class MainSystem:
             stored_did = credentials.get('did')
             
             if stored_did:
-                # Set DID using the webull instance's method (now uses data folder)
-                self.wb._set_did(stored_did, data_folder='data')
+                # Persist DID to the data folder in the background - the write is advisory
+                self._io_pool.submit(self._write_did, stored_did)
                 # Also update the webull instance's _did attribute
                 self.wb._did = stored_did
                 self.logger.info("✅ DID set from stored credentials")
@@ -162,7 +384,7 @@ class MainSystem:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"❌ Authentication error: {e}")
+            self.logger.error("❌ Authentication error: %s", e)
             return False
 
     
@@ -176,25 +398,34 @@ class MainSystem:
                 return False
             
             if self.account_manager.discover_accounts():
+                # Everything below is informational only
+                if not self.logger.isEnabledFor(logging.INFO):
+                    return True
+                
                 summary = self.account_manager.get_account_summary()
                 
-                print()  # Add spacing
-                self.logger.info("📊 ACCOUNT SUMMARY")
-                self.logger.info(f"   Total Accounts: {summary['total_accounts']}")
-                self.logger.info(f"   Total Value: ${summary['total_value']:,.2f}")
-                self.logger.info(f"   Available Cash: ${summary['total_cash']:,.2f}")
-                print()
+                # Build the whole report and emit it as a single log record
+                lines = [
+                    "📊 ACCOUNT SUMMARY",
+                    f"   Total Accounts: {summary['total_accounts']}",
+                    f"   Total Value: ${summary['total_value']:,.2f}",
+                    f"   Available Cash: ${summary['total_cash']:,.2f}",
+                    "",
+                ]
                 
                 # Show each account
                 for i, account in enumerate(summary['accounts'], 1):
                     status = "✅ ENABLED" if account['enabled'] else "❌ DISABLED"
-                    self.logger.info(f"Account {i}: {account['account_type']} - {status}")
-                    self.logger.info(f"   Balance: ${account['net_liquidation']:,.2f}")
-                    self.logger.info(f"   Available: ${account['settled_funds']:,.2f}")
-                    self.logger.info(f"   Positions: {account['positions_count']}")
+                    lines.append(f"Account {i}: {account['account_type']} - {status}")
+                    lines.append(f"   Balance: ${account['net_liquidation']:,.2f}")
+                    lines.append(f"   Available: ${account['settled_funds']:,.2f}")
+                    lines.append(f"   Positions: {account['positions_count']}")
                     if account['enabled']:
-                        self.logger.info(f"   Day Trading: {'✅' if account['day_trading_enabled'] else '❌'} | Options: {'✅' if account['options_enabled'] else '❌'}")
-                    print()
+                        lines.append(f"   Day Trading: {'✅' if account['day_trading_enabled'] else '❌'} | Options: {'✅' if account['options_enabled'] else '❌'}")
+                    lines.append("")
+                
+                print()  # Add spacing
+                self.logger.info("%s", "\n".join(lines))
                 
                 return True
             else:
@@ -208,17 +439,31 @@ class MainSystem:
     def log_system_status(self):
         """Log essential system status"""
         try:
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
+            
             login_info = self.login_manager.get_login_info()
-            self.logger.info("📊 SYSTEM STATUS")
-            self.logger.info(f"   Authentication: {'✅' if login_info['is_logged_in'] else '❌'}")
-            self.logger.info(f"   Accounts Loaded: {len(self.account_manager.accounts) if self.account_manager.accounts else 0}")
-            enabled_count = len(self.account_manager.get_enabled_accounts()) if self.account_manager else 0
-            self.logger.info(f"   Enabled for Trading: {enabled_count}")
+            account_manager = self.account_manager
+            accounts = getattr(account_manager, 'accounts', None)
+            accounts_loaded = len(accounts) if accounts is not None else 0
+            enabled_count = len(account_manager.get_enabled_accounts()) if account_manager is not None else 0
+            self.logger.info("📊 SYSTEM STATUS\n"
+                             "   Authentication: %s\n"
+                             "   Accounts Loaded: %s\n"
+                             "   Enabled for Trading: %s",
+                             '✅' if login_info['is_logged_in'] else '❌', accounts_loaded, enabled_count)
             print()
             
         except Exception as e:
             self.logger.error(f"❌ Error getting system status: {e}")
     
+    def _write_did(self, did: str):
+        """Save DID to did.bin using the webull instance's method (runs on the I/O pool)"""
+        try:
+            self.wb._set_did(did, data_folder='data')
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not save DID file: {e}")
+    
     def run(self) -> bool:
         """Run the complete system workflow"""
         try:
@@ -243,6 +488,14 @@ class MainSystem:
             self.logger.error(f"❌ System workflow failed: {e}")
             return False
     
+    def _stop_log_listener(self):
+        """Drain queued log records, stop the writer thread and flush its handlers"""
+        listener, self._log_listener = self._log_listener, None
+        if listener:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+    
     def cleanup(self):
         """Clean up system resources"""
         try:
@@ -259,6 +512,15 @@ class MainSystem:
                 self.logger.warning(f"⚠️ Cleanup warning: {e}")
             else:
                 print(f"⚠️ Cleanup warning: {e}")
+        
+        # Let pending background writes finish
+        self._io_pool.shutdown(wait=True)
+        
+        # Stop log writers and flush their buffers
+        self._stop_log_listener()
+        if self._log_ring:
+            self._log_ring.close()
+            self._log_ring = None
 
 
 def main():
@@ -271,9 +533,8 @@ def main():
         system = MainSystem()
         success = system.run()
         
-        # Exit with appropriate code
+        # Exit with appropriate code (run() already logged the outcome)
         if success:
-            print("✅ System completed successfully!")
             sys.exit(0)
         else:
             print("❌ System failed! Check logs for details.")
@@ -63,9 +63,9 @@ class webull :
     def _get_did(self, data_folder='data'):
         '''
         Makes a unique device id from a random uuid (uuid.uuid4).
-        if the pickle file doesn't exist, this func will generate a random 32 character hex string
-        uuid and save it in a pickle file for future use. if the file already exists it will
-        load the pickle file to reuse the did. Having a unique did appears to be very important
+        if the did file doesn't exist, this func will generate a random 32 character hex string
+        uuid and save it in the did file for future use. if the file already exists it will
+        load the did file to reuse the did. Having a unique did appears to be very important
         for the MQTT web socket protocol
 
         data_folder: folder to store did.bin file (default: 'data')
@@ -82,14 +82,14 @@ class webull :
         
         if filename.exists():
             try:
-                did = pickle.load(open(filename, 'rb'))
+                did = self._read_did_file(filename)
             except Exception:
                 # If file is corrupted, generate new DID
                 did = uuid.uuid4().hex
-                pickle.dump(did, open(filename, 'wb'))
+                self._write_did_file(filename, did)
         else:
             did = uuid.uuid4().hex
-            pickle.dump(did, open(filename, 'wb'))
+            self._write_did_file(filename, did)
         return did
 
 
@@ -116,9 +116,46 @@ class webull :
         data_path.mkdir(exist_ok=True)
         
         filename = data_path / 'did.bin'
-        pickle.dump(did, open(filename, 'wb'))
+        self._write_did_file(filename, did)
         return True
 
+    def _read_did_file(self, filename):
+        '''
+        Read the did stored in filename. The did is stored as plain ascii text; files
+        pickled by older versions are loaded once and rewritten in the plain format.
+        '''
+        data = filename.read_bytes()
+        if not self._is_legacy_did_pickle(data):
+            did = data.decode('ascii').strip()
+            if not did:
+                raise ValueError('did.bin is empty')
+            return did
+
+        did = pickle.loads(data)
+        if not isinstance(did, str):
+            raise ValueError('did.bin does not contain a did string')
+        self._write_did_file(filename, did)
+        return did
+
+    @staticmethod
+    def _is_legacy_did_pickle(data):
+        '''
+        True if data looks like a pickled did string: protocol 2+ starts with the PROTO
+        opcode (0x80), protocol 0/1 with a string opcode and ends with STOP ('.')
+        '''
+        if data[:1] == b'\x80':
+            return True
+        return data[:1] in (b'V', b'X', b'S', b'T', b'U') and data.endswith(b'.')
+
+    def _write_did_file(self, filename, did):
+        '''
+        Save did to filename as plain ascii text. The file is written to a temporary
+        path and swapped in, so an interrupted write never leaves a truncated did.bin
+        '''
+        tmp_filename = filename.with_name(filename.name + '.tmp')
+        tmp_filename.write_bytes(did.encode('ascii'))
+        os.replace(tmp_filename, filename)
+
     def build_req_headers(self, include_trade_token=False, include_time=False, include_zone_var=True):
         '''
         Build default set of header params